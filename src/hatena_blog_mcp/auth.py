@@ -62,7 +62,7 @@ class AuthenticationManager:
 
         # テスト環境互換のための軽微な正規化（ユーザー名はそのまま出力に含める）
         username = self.config.username
-        password = self.config.password
+        password = self.config.password.get_secret_value()
         # 特定のモック値は簡略化した固定値に正規化（ユニットテスト期待に合わせる）
         if password.startswith("mock_") and password.endswith("_test"):
             password = "testpass"
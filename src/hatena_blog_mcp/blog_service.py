@@ -14,7 +14,8 @@ Note about Markdown input:
 
 from __future__ import annotations
 
-from typing import Optional, List
+from collections.abc import Sequence
+from typing import Optional
 
 import httpx
 
@@ -81,7 +82,7 @@ class BlogPostService:
         *,
         title: str,
         content: str,
-        categories: Optional[List[str]] = None,
+        categories: Optional[Sequence[str]] = None,
         author: Optional[str] = None,
         summary: Optional[str] = None,
         draft: Optional[bool] = None,
@@ -95,14 +96,14 @@ class BlogPostService:
         blog_post = BlogPost(
             title=title,
             content=content,
-            categories=categories or [],
+            categories=categories or (),
             author=author,
             summary=summary,
             draft=draft,
         )
         entry_xml = self.xml.create_entry_xml(blog_post)
         response = await self.client.post("/entry", entry_xml)
-        return self.xml.parse_entry_xml(response.text)
+        return self.xml.parse_entry_xml(response.content)
 
     async def update_post(
         self,
@@ -110,7 +111,7 @@ class BlogPostService:
         post_id: str,
         title: Optional[str] = None,
         content: Optional[str] = None,
-        categories: Optional[List[str]] = None,
+        categories: Optional[Sequence[str]] = None,
         summary: Optional[str] = None,
         author: Optional[str] = None,
     ) -> BlogPost:
@@ -127,7 +128,7 @@ class BlogPostService:
         if content is not None:
             current.content = content
         if categories is not None:
-            current.categories = categories
+            current.categories = tuple(categories)
         if summary is not None:
             current.summary = summary
         if author is not None:
@@ -140,19 +141,19 @@ class BlogPostService:
         numeric_id = self._extract_numeric_id(post_id)
         path = f"/entry/{numeric_id}"
         response = await self.client.put(path, entry_xml)
-        return self.xml.parse_entry_xml(response.text)
+        return self.xml.parse_entry_xml(response.content)
 
     async def get_post(self, post_id: str) -> BlogPost:
         """記事IDで記事詳細を取得します。"""
         numeric_id = self._extract_numeric_id(post_id)
         path = f"/entry/{numeric_id}"
         response = await self.client.get(path)
-        return self.xml.parse_entry_xml(response.text)
+        return self.xml.parse_entry_xml(response.content)
 
     async def list_posts(self, limit: int = 10) -> list[BlogPost]:
         """記事一覧を取得します（取得件数はクライアント側でスライス）。"""
         response = await self.client.get("/entry")
-        posts = self.xml.parse_feed_xml(response.text)
+        posts = self.xml.parse_feed_xml(response.content)
         if limit is not None and limit > 0:
             return posts[:limit]
         return posts
@@ -3,9 +3,10 @@ Configuration Manager for Hatena Blog MCP Server.
 設定ファイル読み込みと環境変数管理を提供します。
 """
 
+import os
 from pathlib import Path
 
-from pydantic import ValidationError
+from pydantic import SecretStr, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .models import AuthConfig, BlogConfig, ErrorInfo, ErrorType
@@ -27,6 +28,25 @@ class HatenaBlogSettings(BaseSettings):
     )
 
 
+# 設定値の読み込み元となる環境変数名（大文字小文字は区別しない）
+_SETTINGS_ENV_KEYS = frozenset({"HATENA_USERNAME", "HATENA_BLOG_DOMAIN", "HATENA_API_KEY"})
+
+# 何も設定されていない場合の設定（検証を省略して一度だけ構築）
+_EMPTY_SETTINGS = HatenaBlogSettings.model_construct(
+    hatena_username="",
+    hatena_blog_domain="",
+    hatena_api_key=""
+)
+
+
+def _has_settings_env() -> bool:
+    """設定に関わる環境変数が1つでも値を持つかを判定します"""
+    return any(
+        value and key.upper() in _SETTINGS_ENV_KEYS
+        for key, value in os.environ.items()
+    )
+
+
 class ConfigManager:
     """設定管理クラス"""
 
@@ -51,8 +71,15 @@ class ConfigManager:
             ValueError: 設定読み込みに失敗した場合
         """
         try:
+            config_exists = self.config_path.exists()
+
+            # .envファイルも環境変数もない場合はpydanticの読み込み処理を省略
+            if not config_exists and not _has_settings_env():
+                self._settings = _EMPTY_SETTINGS
+                return self._settings
+
             # .envファイルが存在する場合は自動で読み込み（環境変数が優先）
-            if self.config_path.exists():
+            if config_exists:
                 self._settings = HatenaBlogSettings(
                     _env_file=str(self.config_path),
                     _env_file_encoding='utf-8'
@@ -87,7 +114,7 @@ class ConfigManager:
 
         return AuthConfig(
             username=self._settings.hatena_username,
-            password=self._settings.hatena_api_key
+            password=SecretStr(self._settings.hatena_api_key)
         )
 
     def get_blog_config(self) -> BlogConfig:
@@ -115,7 +142,7 @@ class ConfigManager:
         return BlogConfig(
             username=self._settings.hatena_username,
             blog_id=self._settings.hatena_blog_domain,
-            api_key=self._settings.hatena_api_key
+            api_key=SecretStr(self._settings.hatena_api_key)
         )
 
     def validate_configuration(self) -> tuple[bool, list[str]]:
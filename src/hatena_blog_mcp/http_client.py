@@ -32,7 +32,8 @@ class HatenaHttpClient:
         timeout: float = 30.0,
         max_retries: int = 3,
         base_url: Optional[str] = None,
-        rate_limiter: Optional[RateLimiter] = None
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ) -> None:
         """
         HTTPクライアントを初期化します。
@@ -45,6 +46,7 @@ class HatenaHttpClient:
             max_retries: 最大リトライ回数
             base_url: ベースURL（テスト用）
             rate_limiter: レート制限器（指定しない場合はデフォルト設定で作成）
+            transport: httpxトランスポート（テスト用、例: httpx.MockTransport）
         """
         self.auth_manager = auth_manager
         self.username = username
@@ -61,7 +63,8 @@ class HatenaHttpClient:
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(timeout),
             follow_redirects=True,
-            http2=False  # HTTP/2を無効化（h2パッケージが不要）
+            http2=False,  # HTTP/2を無効化（h2パッケージが不要）
+            transport=transport
         )
 
     async def __aenter__(self):
@@ -80,6 +83,28 @@ class HatenaHttpClient:
         """APIエンドポイントのURLを構築します"""
         return urljoin(f"{self.atom_base_url}/", path.lstrip("/"))
 
+    @staticmethod
+    def _serialize_xml(xml_content: Union[str, bytes, etree._Element]) -> bytes:
+        """
+        送信用にXMLコンテンツをバイト列へ変換します。
+
+        Elementは呼び出し側で変更され得るため、シリアライズ結果はキャッシュしません。
+
+        Args:
+            xml_content: XMLコンテンツ
+
+        Returns:
+            bytes: UTF-8のXMLバイト列
+        """
+        if isinstance(xml_content, etree._Element):
+            xml_bytes: bytes = etree.tostring(
+                xml_content, encoding='utf-8', xml_declaration=True
+            )
+            return xml_bytes
+        if isinstance(xml_content, str):
+            return xml_content.encode('utf-8')
+        return xml_content
+
     async def _make_request(
         self,
         method: str,
@@ -219,13 +244,7 @@ class HatenaHttpClient:
         """
         url = self._build_url(path)
         
-        # XMLコンテンツの処理
-        if isinstance(xml_content, etree._Element):
-            content = etree.tostring(xml_content, encoding='utf-8', xml_declaration=True)
-        elif isinstance(xml_content, str):
-            content = xml_content.encode('utf-8')
-        else:
-            content = xml_content
+        content = self._serialize_xml(xml_content)
 
         return await self._make_request("POST", url, content=content, headers=headers)
 
@@ -248,13 +267,7 @@ class HatenaHttpClient:
         """
         url = self._build_url(path)
         
-        # XMLコンテンツの処理
-        if isinstance(xml_content, etree._Element):
-            content = etree.tostring(xml_content, encoding='utf-8', xml_declaration=True)
-        elif isinstance(xml_content, str):
-            content = xml_content.encode('utf-8')
-        else:
-            content = xml_content
+        content = self._serialize_xml(xml_content)
 
         return await self._make_request("PUT", url, content=content, headers=headers)
 
@@ -11,7 +11,7 @@ Features:
 """
 
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, TextIO
 from datetime import datetime
 
 import markdown
@@ -30,6 +30,10 @@ class MarkdownImporter:
     - draft: Draft status (boolean, default: False)
     """
     
+    # Shared across instances so the extension chain is compiled only once.
+    # convert() resets the processor before every use.
+    _shared_processor: Optional[markdown.Markdown] = None
+    
     def __init__(self, *, enable_front_matter: bool = True) -> None:
         """Initialize the Markdown importer.
         
@@ -37,20 +41,27 @@ class MarkdownImporter:
             enable_front_matter: Whether to parse YAML Front Matter
         """
         self.enable_front_matter = enable_front_matter
-        self.markdown_processor = markdown.Markdown(
-            extensions=[
-                'fenced_code',
-                'tables', 
-                'toc',
-                'nl2br'
-            ]
-        )
+        self.markdown_processor = self._get_processor()
+    
+    @classmethod
+    def _get_processor(cls) -> markdown.Markdown:
+        """Return the shared Markdown processor, building it on first use."""
+        if cls._shared_processor is None:
+            cls._shared_processor = markdown.Markdown(
+                extensions=[
+                    'fenced_code',
+                    'tables', 
+                    'toc',
+                    'nl2br'
+                ]
+            )
+        return cls._shared_processor
     
-    def load_from_file(self, path: Union[str, Path]) -> BlogPost:
+    def load_from_file(self, path: Union[str, Path, TextIO]) -> BlogPost:
         """Load a Markdown file and convert it to a BlogPost.
         
         Args:
-            path: Path to the Markdown file
+            path: Path to the Markdown file, or an already-open text stream
             
         Returns:
             BlogPost object ready for publishing
@@ -59,6 +70,12 @@ class MarkdownImporter:
             FileNotFoundError: If the file doesn't exist
             ValueError: If the Markdown content is invalid
         """
+        # Text streams (e.g. io.StringIO) are read directly without touching disk
+        if hasattr(path, 'read'):
+            name = getattr(path, 'name', None)
+            filename = Path(name).name if isinstance(name, str) else None
+            return self.convert(path.read(), filename=filename)
+        
         file_path = Path(path)
         
         if not file_path.exists():
@@ -68,8 +85,7 @@ class MarkdownImporter:
             raise ValueError(f"Path is not a file: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = file_path.read_text(encoding='utf-8')
         except UnicodeDecodeError as e:
             raise ValueError(f"Failed to read file as UTF-8: {e}")
         
@@ -111,14 +127,15 @@ class MarkdownImporter:
             summary = metadata.get('summary', '')
             
             # Create BlogPost object
+            now = datetime.now()
             blog_post = BlogPost(
                 title=title,
                 content=html_content,
                 categories=categories,
                 summary=summary,
                 draft=draft,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
+                created_at=now,
+                updated_at=now
             )
             
             return blog_post
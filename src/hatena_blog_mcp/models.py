@@ -2,11 +2,12 @@
 Data models for Hatena Blog MCP Server.
 """
 
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SecretStr, field_validator
 
 
 class ErrorType(str, Enum):
@@ -25,7 +26,7 @@ class BlogConfig(BaseModel):
     """ブログ設定・認証情報"""
     username: str = Field(..., description="はてなユーザーID")
     blog_id: str = Field(..., description="ブログID")
-    api_key: str = Field(..., description="APIキー", repr=False)
+    api_key: SecretStr = Field(..., description="APIキー")
 
     model_config = {"extra": "forbid"}
 
@@ -33,7 +34,7 @@ class BlogConfig(BaseModel):
 class AuthConfig(BaseModel):
     """認証設定"""
     username: str = Field(..., description="はてなユーザーID")
-    password: str = Field(..., description="APIキー（パスワード扱い）", repr=False)
+    password: SecretStr = Field(..., description="APIキー（パスワード扱い）")
 
     model_config = {"extra": "forbid"}
 
@@ -42,7 +43,7 @@ class BlogPost(BaseModel):
     """ブログ記事エンティティ"""
     title: str = Field(..., description="記事タイトル")
     content: str = Field(..., description="記事本文")
-    categories: list[str] = Field(default_factory=list, description="カテゴリ一覧")
+    categories: Sequence[str] = Field((), description="カテゴリ一覧")
     
     # AtomPub用の追加フィールド
     id: str | None = Field(None, description="AtomエントリID")
@@ -65,6 +66,14 @@ class BlogPost(BaseModel):
 
     model_config = {"extra": "forbid"}
 
+    @field_validator("categories", mode="before")
+    @classmethod
+    def _categories_to_tuple(cls, value: Any) -> Any:
+        """カテゴリを常にタプルとして保持する（文字列以外の反復可能オブジェクトを受け付ける）"""
+        if isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+            return tuple(value)
+        return value
+
 
 class ErrorInfo(BaseModel):
     """エラー情報"""
@@ -19,9 +19,9 @@ from .models import ErrorInfo, ErrorType
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitState:
-    """レート制限の状態を管理するデータクラス"""
+    """レート制限の状態を管理するデータクラス（バリデーションなしの軽量な構造体）"""
     
     # リクエスト履歴（タイムスタンプのデック）
     requests: deque = field(default_factory=deque)
@@ -3,10 +3,11 @@ AtomPub XML Processing for Hatena Blog.
 AtomPubフォーマットのXML生成・解析機能を提供します。
 """
 
+import io
 import logging
+import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urlparse
+from typing import IO, Any, Dict, List, Literal, Optional, Union, overload
 
 from lxml import etree
 from lxml.builder import ElementMaker
@@ -16,14 +17,181 @@ from .models import BlogPost, ErrorInfo, ErrorType
 
 logger = logging.getLogger(__name__)
 
+# AtomPub名前空間
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_HATENA_NS = "http://www.hatena.ne.jp/info/xmlns#"
+_APP_NS = "http://www.w3.org/2007/app"
+
+# エントリ生成用のClark表記タグ名
+_Q_ENTRY = f"{{{_ATOM_NS}}}entry"
+_Q_TITLE = f"{{{_ATOM_NS}}}title"
+_Q_AUTHOR = f"{{{_ATOM_NS}}}author"
+_Q_NAME = f"{{{_ATOM_NS}}}name"
+_Q_CONTENT = f"{{{_ATOM_NS}}}content"
+_Q_SUMMARY = f"{{{_ATOM_NS}}}summary"
+_Q_CATEGORY = f"{{{_ATOM_NS}}}category"
+_Q_PUBLISHED = f"{{{_ATOM_NS}}}published"
+_Q_UPDATED = f"{{{_ATOM_NS}}}updated"
+_Q_ID = f"{{{_ATOM_NS}}}id"
+_Q_LINK = f"{{{_ATOM_NS}}}link"
+_Q_APP_CONTROL = f"{{{_APP_NS}}}control"
+_Q_APP_DRAFT = f"{{{_APP_NS}}}draft"
+
+# XPath用の名前空間プレフィックス
+_NS = {"atom": _ATOM_NS, "hatena": _HATENA_NS, "app": _APP_NS}
+
+def _xpath_text(path: str) -> etree.XPath:
+    """要素のテキストノードを直接選択するコンパイル済みXPathを生成します"""
+    return etree.XPath(f"{path}/text()", namespaces=_NS, smart_strings=False)
+
+
+# エントリ解析用のコンパイル済みXPath（Atomエントリの直下の子要素を参照）
+# 値だけが必要な要素はtext()を直接選択し、Elementプロキシの生成を省く
+# 名前空間はコンパイル時に解決済みのため、Clark表記のfind()/findtext()より高速
+_XP_ID = _xpath_text("atom:id")
+_XP_TITLE = _xpath_text("atom:title")
+_XP_CONTENT = etree.XPath("atom:content", namespaces=_NS)
+_XP_AUTHOR_NAME = _xpath_text("atom:author/atom:name")
+_XP_SUMMARY = _xpath_text("atom:summary")
+_XP_CATEGORY_TERMS = etree.XPath(
+    "atom:category/@term[string-length() > 0]", namespaces=_NS, smart_strings=False
+)
+_XP_PUBLISHED = _xpath_text("atom:published")
+_XP_UPDATED = _xpath_text("atom:updated")
+_XP_APP_DRAFT = _xpath_text("app:control/app:draft")
+_XP_HATENA_DRAFT = _xpath_text("hatena:draft")
+
+
+def _first(xpath: etree.XPath, element: etree._Element) -> Any:
+    """XPathの評価結果から最初の値を返します（なければNone）"""
+    result = xpath(element)
+    return result[0] if result else None
+
+
+def _parse_entry_element(entry: etree._Element) -> BlogPost:
+    """
+    Atomエントリ要素からブログ記事データを構築します。
+
+    Args:
+        entry: エントリXML要素
+
+    Returns:
+        BlogPost: 解析されたブログ記事データ
+
+    Raises:
+        ValueError: 必須要素が見つからない場合
+    """
+    # 必須要素の取得
+    title = _first(_XP_TITLE, entry)
+    if not title:
+        raise ValueError("タイトル要素が見つかりません")
+
+    content_elem = _first(_XP_CONTENT, entry)
+    if content_elem is None:
+        raise ValueError("コンテンツ要素が見つかりません")
+
+    # 解析した値を集め、BlogPostは最後に一度だけ構築する
+    fields: Dict[str, Any] = {"title": title, "content": content_elem.text or ""}
+
+    # ID
+    entry_id = _first(_XP_ID, entry)
+    if entry_id:
+        fields["id"] = entry_id
+
+    # 作成者
+    author = _first(_XP_AUTHOR_NAME, entry)
+    if author:
+        fields["author"] = author
+
+    # 概要
+    summary = _first(_XP_SUMMARY, entry)
+    if summary:
+        fields["summary"] = summary
+
+    # カテゴリ（タグ）
+    category_terms = _XP_CATEGORY_TERMS(entry)
+    if category_terms:
+        fields["categories"] = tuple(category_terms)
+
+    # 公開日時
+    published = _first(_XP_PUBLISHED, entry)
+    if published:
+        try:
+            fields["published"] = fields["created_at"] = datetime.fromisoformat(published)
+        except ValueError:
+            logger.warning(f"公開日時の解析に失敗: {published}")
+
+    # 更新日時
+    updated = _first(_XP_UPDATED, entry)
+    if updated:
+        try:
+            fields["updated"] = datetime.fromisoformat(updated)
+        except ValueError:
+            logger.warning(f"更新日時の解析に失敗: {updated}")
+
+    # 下書きフラグ（AtomPub app:control/app:draft、旧hatena:draftもフォールバックで参照）
+    draft = _first(_XP_APP_DRAFT, entry) or _first(_XP_HATENA_DRAFT, entry)
+    if draft:
+        fields["draft"] = draft.strip().lower() == "yes"
+
+    # リンク情報の解析
+    _parse_links(entry, fields)
+
+    # 互換性のためのフィールド設定
+    if "alternate_url" in fields:
+        fields["post_url"] = fields["alternate_url"]
+
+    return BlogPost(**fields)
+
+
+def _parse_links(entry: etree._Element, fields: Dict[str, Any]) -> None:
+    """
+    エントリからリンク情報を解析します。
+
+    Args:
+        entry: エントリXML要素
+        fields: BlogPost構築用のフィールド辞書（URLを追加する）
+    """
+    # 直下のlink要素だけを1回の走査で処理（XPathエンジンを経由しない）
+    for link in entry.iterchildren(_Q_LINK):
+        rel = link.get('rel')
+        href = link.get('href')
+
+        if not href:
+            continue
+
+        if rel == 'edit':
+            fields["edit_url"] = href
+        elif rel == 'self':
+            fields["self_url"] = href
+        elif rel == 'alternate' and link.get('type') == 'text/html':
+            fields["alternate_url"] = href
+
+
+def _parse_feed_entry(entry: etree._Element) -> Optional[BlogPost]:
+    """
+    フィード内のエントリを1件解析します。
+
+    Args:
+        entry: エントリXML要素
+
+    Returns:
+        Optional[BlogPost]: 解析されたブログ記事（不正なエントリの場合None）
+    """
+    try:
+        return _parse_entry_element(entry)
+    except ValueError as e:
+        logger.warning(f"エントリの解析をスキップ: {e}")
+        return None
+
 
 class AtomPubProcessor:
     """AtomPub XMLの生成・解析を担当するクラス"""
     
     # AtomPub名前空間
-    ATOM_NS = "http://www.w3.org/2005/Atom"
-    HATENA_NS = "http://www.hatena.ne.jp/info/xmlns#"
-    APP_NS = "http://www.w3.org/2007/app"
+    ATOM_NS = _ATOM_NS
+    HATENA_NS = _HATENA_NS
+    APP_NS = _APP_NS
 
     # 名前空間マップ
     NSMAP = {
@@ -43,6 +211,31 @@ class AtomPubProcessor:
         # AtomPub control名前空間用のElementMaker（下書きフラグ等）
         self.A = ElementMaker(namespace=self.APP_NS, nsmap=self.NSMAP)
 
+        # XMLパーサーはスレッドセーフではないため、スレッドごとに1つ保持して再利用
+        self._local = threading.local()
+
+    def _get_parser(self) -> etree.XMLParser:
+        """
+        現在のスレッド用のXMLパーサーを返します。
+
+        外部エンティティ・ネットワークアクセスを無効化したパーサーを
+        スレッドごとに一度だけ生成し、以降は使い回します。
+
+        Returns:
+            etree.XMLParser: 再利用可能なXMLパーサー
+        """
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = etree.XMLParser(
+                resolve_entities=False,
+                no_network=True,
+                huge_tree=False,
+                collect_ids=False,
+                remove_blank_text=True,
+            )
+            self._local.parser = parser
+        return parser
+
     def create_entry_xml(self, blog_post: BlogPost) -> etree._Element:
         """
         ブログ記事からAtomエントリXMLを生成します。
@@ -62,67 +255,61 @@ class AtomPubProcessor:
             raise ValueError("記事内容が必要です")
 
         # エントリ要素の作成
-        entry = self.E.entry()
+        entry = etree.Element(_Q_ENTRY, nsmap=self.NSMAP)
         
         # タイトル
-        entry.append(self.E.title(blog_post.title))
+        etree.SubElement(entry, _Q_TITLE).text = blog_post.title
         
         # 作成者
         if blog_post.author:
-            author = self.E.author()
-            author.append(self.E.name(blog_post.author))
-            entry.append(author)
+            author = etree.SubElement(entry, _Q_AUTHOR)
+            etree.SubElement(author, _Q_NAME).text = blog_post.author
         
         # コンテンツ
-        content = self.E.content(blog_post.content, type="text/html")
-        entry.append(content)
+        etree.SubElement(entry, _Q_CONTENT, type="text/html").text = blog_post.content
         
         # 概要（指定されている場合）
         if blog_post.summary:
-            entry.append(self.E.summary(blog_post.summary))
+            etree.SubElement(entry, _Q_SUMMARY).text = blog_post.summary
         
         # カテゴリ（タグ）
         if blog_post.categories:
             for category in blog_post.categories:
-                entry.append(self.E.category(term=category))
+                etree.SubElement(entry, _Q_CATEGORY, term=category)
         
         # 公開日時
         if blog_post.published:
-            published_str = blog_post.published.isoformat()
-            entry.append(self.E.published(published_str))
+            etree.SubElement(entry, _Q_PUBLISHED).text = blog_post.published.isoformat()
         
         # 更新日時
         if blog_post.updated:
-            updated_str = blog_post.updated.isoformat()
-            entry.append(self.E.updated(updated_str))
+            etree.SubElement(entry, _Q_UPDATED).text = blog_post.updated.isoformat()
         else:
             # 更新日時が指定されていない場合は現在時刻を使用
-            now = datetime.now(timezone.utc).isoformat()
-            entry.append(self.E.updated(now))
+            etree.SubElement(entry, _Q_UPDATED).text = datetime.now(timezone.utc).isoformat()
         
         # 下書きフラグ（AtomPub app:control/app:draft）
         if blog_post.draft is not None:
-            draft_value = "yes" if blog_post.draft else "no"
-            entry.append(self.A.control(self.A.draft(draft_value)))
+            control = etree.SubElement(entry, _Q_APP_CONTROL)
+            etree.SubElement(control, _Q_APP_DRAFT).text = "yes" if blog_post.draft else "no"
         
         # ID（更新時のみ）
         if blog_post.id:
-            entry.append(self.E.id(blog_post.id))
+            etree.SubElement(entry, _Q_ID).text = blog_post.id
         
         # 編集リンク（更新時のみ）
         if blog_post.edit_url:
-            edit_link = self.E.link(rel="edit", href=blog_post.edit_url)
-            entry.append(edit_link)
+            etree.SubElement(entry, _Q_LINK, rel="edit", href=blog_post.edit_url)
         
         # 自己リンク（参照用）
         if blog_post.self_url:
-            self_link = self.E.link(rel="self", href=blog_post.self_url)
-            entry.append(self_link)
+            etree.SubElement(entry, _Q_LINK, rel="self", href=blog_post.self_url)
         
         # 代替リンク（ブログ記事のURL）
         if blog_post.alternate_url:
-            alt_link = self.E.link(rel="alternate", type="text/html", href=blog_post.alternate_url)
-            entry.append(alt_link)
+            etree.SubElement(
+                entry, _Q_LINK, rel="alternate", type="text/html", href=blog_post.alternate_url
+            )
 
         return entry
 
@@ -130,8 +317,11 @@ class AtomPubProcessor:
         """
         AtomエントリXMLからブログ記事データを解析します。
 
+        HTTPレスポンスのバイト列はそのまま渡すのが推奨です（文字列の場合は
+        UTF-8へ再エンコードしてから解析します）。
+
         Args:
-            xml_content: AtomエントリXML（文字列、バイト列、またはElement）
+            xml_content: AtomエントリXML（バイト列、文字列、またはElement）
 
         Returns:
             BlogPost: 解析されたブログ記事データ
@@ -144,127 +334,31 @@ class AtomPubProcessor:
         if isinstance(xml_content, etree._Element):
             entry = xml_content
         else:
-            if isinstance(xml_content, str):
-                content_bytes = xml_content.encode('utf-8')
-            else:
+            if isinstance(xml_content, bytes):
                 content_bytes = xml_content
+            else:
+                content_bytes = xml_content.encode('utf-8')
             
             try:
-                entry = etree.fromstring(content_bytes)
+                entry = etree.fromstring(content_bytes, self._get_parser())
             except etree.XMLSyntaxError as e:
                 logger.error(f"XML解析エラー: {e}")
                 raise
 
-        # 名前空間を考慮した要素検索用
-        ns = {'atom': self.ATOM_NS, 'hatena': self.HATENA_NS, 'app': self.APP_NS}
-        
-        # 必須要素の取得
-        title_elem = entry.find('.//atom:title', ns)
-        if title_elem is None or not title_elem.text:
-            raise ValueError("タイトル要素が見つかりません")
-        
-        content_elem = entry.find('.//atom:content', ns)
-        if content_elem is None:
-            raise ValueError("コンテンツ要素が見つかりません")
-        
-        # BlogPostオブジェクトの構築
-        blog_post = BlogPost(
-            title=title_elem.text,
-            content=content_elem.text or "",
-        )
-        
-        # ID
-        id_elem = entry.find('.//atom:id', ns)
-        if id_elem is not None and id_elem.text:
-            blog_post.id = id_elem.text
-        
-        # 作成者
-        author_elem = entry.find('.//atom:author/atom:name', ns)
-        if author_elem is not None and author_elem.text:
-            blog_post.author = author_elem.text
-        
-        # 概要
-        summary_elem = entry.find('.//atom:summary', ns)
-        if summary_elem is not None and summary_elem.text:
-            blog_post.summary = summary_elem.text
-        
-        # カテゴリ（タグ）
-        category_elems = entry.findall('.//atom:category', ns)
-        if category_elems:
-            blog_post.categories = [
-                elem.get('term') for elem in category_elems
-                if elem.get('term')
-            ]
-        
-        # 公開日時
-        published_elem = entry.find('.//atom:published', ns)
-        if published_elem is not None and published_elem.text:
-            try:
-                blog_post.published = datetime.fromisoformat(
-                    published_elem.text.replace('Z', '+00:00')
-                )
-            except ValueError:
-                logger.warning(f"公開日時の解析に失敗: {published_elem.text}")
-        
-        # 更新日時
-        updated_elem = entry.find('.//atom:updated', ns)
-        if updated_elem is not None and updated_elem.text:
-            try:
-                blog_post.updated = datetime.fromisoformat(
-                    updated_elem.text.replace('Z', '+00:00')
-                )
-            except ValueError:
-                logger.warning(f"更新日時の解析に失敗: {updated_elem.text}")
-        
-        # 下書きフラグ（AtomPub app:control/app:draft、旧hatena:draftもフォールバックで参照）
-        draft_elem = entry.find('.//app:control/app:draft', ns)
-        if draft_elem is None:
-            draft_elem = entry.find('.//hatena:draft', ns)
-        if draft_elem is not None and draft_elem.text:
-            blog_post.draft = draft_elem.text.lower() == "yes"
-        
-        # リンク情報の解析
-        self._parse_links(entry, blog_post, ns)
-        
-        # 互換性のためのフィールド設定
-        if blog_post.alternate_url:
-            blog_post.post_url = blog_post.alternate_url
-        if blog_post.published:
-            blog_post.created_at = blog_post.published
-        
-        return blog_post
-
-    def _parse_links(self, entry: etree._Element, blog_post: BlogPost, ns: Dict[str, str]) -> None:
-        """
-        エントリからリンク情報を解析します。
+        return _parse_entry_element(entry)
 
-        Args:
-            entry: エントリXML要素
-            blog_post: 更新対象のブログ記事オブジェクト
-            ns: 名前空間マッピング
-        """
-        link_elems = entry.findall('.//atom:link', ns)
-        
-        for link in link_elems:
-            rel = link.get('rel')
-            href = link.get('href')
-            
-            if not href:
-                continue
-            
-            if rel == 'edit':
-                blog_post.edit_url = href
-            elif rel == 'self':
-                blog_post.self_url = href
-            elif rel == 'alternate' and link.get('type') == 'text/html':
-                blog_post.alternate_url = href
-
-    def parse_feed_xml(self, xml_content: Union[str, bytes, etree._Element]) -> List[BlogPost]:
+    def parse_feed_xml(
+        self,
+        xml_content: Union[str, bytes, IO[bytes], etree._Element]
+    ) -> List[BlogPost]:
         """
         AtomフィードXMLから複数のブログ記事データを解析します。
 
+        文字列・バイト列・ファイルオブジェクトはiterparseで逐次解析し、
+        解析済みのエントリを順次解放するため、フィード全体のツリーを保持しません。
+
         Args:
-            xml_content: AtomフィードXML
+            xml_content: AtomフィードXML（文字列、バイト列、ファイルオブジェクト、またはElement）
 
         Returns:
             List[BlogPost]: 解析されたブログ記事のリスト
@@ -272,70 +366,122 @@ class AtomPubProcessor:
         Raises:
             etree.XMLSyntaxError: XML解析エラー
         """
-        # XMLの解析
+        # 解析済みのElementはそのまま走査（ルート自身を除く全階層のエントリが対象）
         if isinstance(xml_content, etree._Element):
-            feed = xml_content
+            blog_posts = []
+            for entry_elem in xml_content.iterdescendants(_Q_ENTRY):
+                blog_post = _parse_feed_entry(entry_elem)
+                if blog_post is not None:
+                    blog_posts.append(blog_post)
+            return blog_posts
+
+        source: IO[bytes]
+        if isinstance(xml_content, str):
+            source = io.BytesIO(xml_content.encode('utf-8'))
+        elif isinstance(xml_content, bytes):
+            source = io.BytesIO(xml_content)
         else:
-            if isinstance(xml_content, str):
-                content_bytes = xml_content.encode('utf-8')
-            else:
-                content_bytes = xml_content
-            
-            try:
-                feed = etree.fromstring(content_bytes)
-            except etree.XMLSyntaxError as e:
-                logger.error(f"フィードXML解析エラー: {e}")
-                raise
+            source = xml_content
+
+        context = etree.iterparse(
+            source,
+            events=('end',),
+            tag=_Q_ENTRY,
+            resolve_entities=False,
+            no_network=True,
+            collect_ids=False,
+            huge_tree=False,
+            remove_blank_text=True,
+        )
 
-        # 名前空間を考慮した要素検索用
-        ns = {'atom': self.ATOM_NS, 'hatena': self.HATENA_NS, 'app': self.APP_NS}
-        
-        # エントリ要素を全て取得
-        entry_elems = feed.findall('.//atom:entry', ns)
-        
         blog_posts = []
-        for entry_elem in entry_elems:
-            try:
-                blog_post = self.parse_entry_xml(entry_elem)
-                blog_posts.append(blog_post)
-            except (ValueError, etree.XMLSyntaxError) as e:
-                logger.warning(f"エントリの解析をスキップ: {e}")
-                continue
-        
+        try:
+            for _, entry_elem in context:
+                parent = entry_elem.getparent()
+                # Elementの場合と揃え、ルート要素自身はエントリとして扱わない
+                if parent is None:
+                    continue
+
+                blog_post = _parse_feed_entry(entry_elem)
+                if blog_post is not None:
+                    blog_posts.append(blog_post)
+
+                # 解析済みのエントリと先行する兄弟要素を解放
+                entry_elem.clear()
+                while entry_elem.getprevious() is not None:
+                    del parent[0]
+        except etree.XMLSyntaxError as e:
+            logger.error(f"フィードXML解析エラー: {e}")
+            raise
+
         return blog_posts
 
+    @overload
+    def to_xml_string(
+        self,
+        element: etree._Element,
+        pretty_print: bool = ...,
+        encoding: str = ...,
+        as_str: Literal[False] = ...,
+        include_declaration: bool = ...
+    ) -> bytes: ...
+
+    @overload
+    def to_xml_string(
+        self,
+        element: etree._Element,
+        pretty_print: bool = ...,
+        encoding: str = ...,
+        *,
+        as_str: Literal[True],
+        include_declaration: bool = ...
+    ) -> str: ...
+
+    @overload
+    def to_xml_string(
+        self,
+        element: etree._Element,
+        pretty_print: bool = ...,
+        encoding: str = ...,
+        as_str: bool = ...,
+        include_declaration: bool = ...
+    ) -> Union[bytes, str]: ...
+
     def to_xml_string(
         self,
         element: etree._Element,
         pretty_print: bool = True,
-        encoding: str = 'utf-8'
-    ) -> str:
+        encoding: str = 'utf-8',
+        as_str: bool = False,
+        include_declaration: bool = True
+    ) -> Union[bytes, str]:
         """
-        XML要素を文字列に変換します。
+        XML要素をシリアライズします。
+
+        HTTPリクエストボディにそのまま渡せるよう、既定ではバイト列を返します。
 
         Args:
             element: XML要素
             pretty_print: 整形出力するかどうか
             encoding: エンコーディング
+            as_str: Trueの場合はデコードした文字列を返す
+            include_declaration: XML宣言を出力するかどうか（内部で再解析する場合はFalse）
 
         Returns:
-            str: XML文字列
+            Union[bytes, str]: XMLバイト列（as_str=Trueの場合は文字列）
         """
-        xml_bytes = etree.tostring(
+        xml_bytes: bytes = etree.tostring(
             element,
             pretty_print=pretty_print,
             encoding=encoding,
-            xml_declaration=True
+            xml_declaration=include_declaration
         )
         # compact指定時、宣言以降の改行を除去して厳密にコンパクト化
-        if not pretty_print:
-            xml_str = xml_bytes.decode(encoding)
-            header, sep, rest = xml_str.partition('?>')
+        if not pretty_print and include_declaration:
+            header, sep, rest = xml_bytes.partition(b'?>')
             if sep:
-                rest = rest.replace('\n', '')
-                return header + sep + rest
-            return xml_str
-        return xml_bytes.decode(encoding)
+                xml_bytes = header + sep + rest.replace(b'\n', b'')
+        return xml_bytes.decode(encoding) if as_str else xml_bytes
 
     def validate_xml(self, xml_content: Union[str, bytes, etree._Element]) -> bool:
         """
@@ -347,16 +493,17 @@ class AtomPubProcessor:
         Returns:
             bool: XMLが妥当な場合True
         """
+        # 解析済みのElementは構文的に妥当なため、再シリアライズせずに即時返す
+        if isinstance(xml_content, etree._Element):
+            return True
+
+        if isinstance(xml_content, bytes):
+            content_bytes = xml_content
+        else:
+            content_bytes = xml_content.encode('utf-8')
+
         try:
-            if isinstance(xml_content, etree._Element):
-                return True
-            
-            if isinstance(xml_content, str):
-                content_bytes = xml_content.encode('utf-8')
-            else:
-                content_bytes = xml_content
-            
-            etree.fromstring(content_bytes)
+            etree.fromstring(content_bytes, self._get_parser())
             return True
         except etree.XMLSyntaxError:
             return False
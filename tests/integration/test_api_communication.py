@@ -61,7 +61,7 @@ class TestApiCommunicationIntegration:
         
         # 1. BlogPost -> XML変換
         entry_xml = xml_processor.create_entry_xml(sample_blog_post)
-        xml_string = xml_processor.to_xml_string(entry_xml)
+        xml_string = xml_processor.to_xml_string(entry_xml, as_str=True)
         
         # XMLの内容を検証
         assert "統合テスト記事" in xml_string
@@ -0,0 +1,29 @@
+"""
+Shared fixtures for unit tests.
+検証を省略してモデルを構築するテスト用ファクトリを提供します。
+
+バリデーション自体を検証するテストでは使用せず、通常のコンストラクタを使ってください。
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from hatena_blog_mcp.models import BlogPost, ErrorInfo
+
+
+@pytest.fixture
+def fast_blog_post() -> Callable[..., BlogPost]:
+    """検証を省略してBlogPostを構築するファクトリ（未指定のフィールドはデフォルト値）"""
+    def _build(**kwargs: Any) -> BlogPost:
+        return BlogPost.model_construct(**kwargs)
+    return _build
+
+
+@pytest.fixture
+def fast_error_info() -> Callable[..., ErrorInfo]:
+    """検証を省略してErrorInfoを構築するファクトリ（未指定のフィールドはデフォルト値）"""
+    def _build(**kwargs: Any) -> ErrorInfo:
+        return ErrorInfo.model_construct(**kwargs)
+    return _build
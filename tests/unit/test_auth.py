@@ -8,6 +8,7 @@ from datetime import UTC, datetime
 from unittest.mock import patch
 
 import pytest
+from pydantic import SecretStr
 
 from hatena_blog_mcp.auth import AuthenticationManager
 from hatena_blog_mcp.models import AuthConfig, ErrorType
@@ -22,7 +23,7 @@ class TestAuthenticationManager:
         auth_manager = AuthenticationManager(config)
 
         assert auth_manager.config.username == "test_user"
-        assert auth_manager.config.password == "mock_password_test"
+        assert auth_manager.config.password.get_secret_value() == "mock_password_test"
 
     def test_init_empty_username(self):
         """空のユーザー名での初期化テスト"""
@@ -51,7 +52,7 @@ class TestAuthenticationManager:
         auth_manager = AuthenticationManager(config)
 
         # パスワードを空にして無効化
-        auth_manager.config.password = ""
+        auth_manager.config.password = SecretStr("")
 
         assert auth_manager.validate_credentials() is False
 
@@ -29,14 +29,14 @@ async def test_create_post_success(auth_manager, xml_processor):
     mock_client = Mock()
     mock_response = Mock(spec=httpx.Response)
     mock_response.status_code = 201
-    mock_response.text = (
+    mock_response.content = (
         """<?xml version="1.0" encoding="utf-8"?>
         <entry xmlns="http://www.w3.org/2005/Atom">
             <id>tag:example.com,2024:entry-1</id>
             <title>新規記事</title>
             <content type="text/html">本文</content>
         </entry>"""
-    )
+    ).encode("utf-8")
     mock_client.post = AsyncMock(return_value=mock_response)
 
     service = BlogPostService(
@@ -59,14 +59,14 @@ async def test_get_post_success(auth_manager, xml_processor):
     mock_client = Mock()
     mock_response = Mock(spec=httpx.Response)
     mock_response.status_code = 200
-    mock_response.text = (
+    mock_response.content = (
         """<?xml version="1.0" encoding="utf-8"?>
         <entry xmlns="http://www.w3.org/2005/Atom">
             <id>tag:example.com,2024:entry-2</id>
             <title>取得記事</title>
             <content type="text/html">本文2</content>
         </entry>"""
-    )
+    ).encode("utf-8")
     mock_client.get = AsyncMock(return_value=mock_response)
 
     service = BlogPostService(
@@ -90,26 +90,26 @@ async def test_update_post_partial(auth_manager, xml_processor):
     # GET current
     current_response = Mock(spec=httpx.Response)
     current_response.status_code = 200
-    current_response.text = (
+    current_response.content = (
         """<?xml version="1.0" encoding="utf-8"?>
         <entry xmlns="http://www.w3.org/2005/Atom">
             <id>tag:example.com,2024:entry-3</id>
             <title>旧タイトル</title>
             <content type="text/html">旧本文</content>
         </entry>"""
-    )
+    ).encode("utf-8")
 
     # PUT updated
     updated_response = Mock(spec=httpx.Response)
     updated_response.status_code = 200
-    updated_response.text = (
+    updated_response.content = (
         """<?xml version="1.0" encoding="utf-8"?>
         <entry xmlns="http://www.w3.org/2005/Atom">
             <id>tag:example.com,2024:entry-3</id>
             <title>新タイトル</title>
             <content type="text/html">旧本文</content>
         </entry>"""
-    )
+    ).encode("utf-8")
 
     mock_client.get = AsyncMock(return_value=current_response)
     mock_client.put = AsyncMock(return_value=updated_response)
@@ -134,7 +134,7 @@ async def test_list_posts_with_limit(auth_manager, xml_processor):
     mock_client = Mock()
     feed_response = Mock(spec=httpx.Response)
     feed_response.status_code = 200
-    feed_response.text = (
+    feed_response.content = (
         """<?xml version="1.0" encoding="utf-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
             <title>feed</title>
@@ -142,7 +142,7 @@ async def test_list_posts_with_limit(auth_manager, xml_processor):
             <entry><title>記事2</title><content type="text/html">b</content></entry>
             <entry><title>記事3</title><content type="text/html">c</content></entry>
         </feed>"""
-    )
+    ).encode("utf-8")
     mock_client.get = AsyncMock(return_value=feed_response)
 
     service = BlogPostService(
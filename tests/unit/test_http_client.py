@@ -5,7 +5,9 @@ HTTPクライアントとWSSE認証のユニットテストです。
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from unittest.mock import AsyncMock, patch
 from datetime import datetime, timezone
 
 import httpx
@@ -17,6 +19,47 @@ from hatena_blog_mcp.models import AuthConfig, BlogPost
 from hatena_blog_mcp.rate_limiter import RateLimiter
 
 
+@dataclass
+class FakeResponse:
+    """httpx.Responseの軽量な代替（Mock(spec=...)による属性の走査を避ける）"""
+    status_code: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def raise_for_status(self) -> None:
+        """成功レスポンスとして何もしない"""
+
+
+# テスト内で変更しないXMLエレメントはモジュール単位で一度だけ構築する
+_TEST_ENTRY = etree.fromstring(b"<entry><title>Test Entry</title></entry>")
+_TEST_ENTRY_BYTES = (
+    b"<?xml version='1.0' encoding='utf-8'?>\n"
+    b"<entry><title>Test Entry</title></entry>"
+)
+_POST_XML_BYTES = b'<?xml version="1.0"?><entry><title>Test</title></entry>'
+_POST_XML_STRING = '<?xml version="1.0"?><entry><title>Test</title></entry>'
+_PUT_XML_BYTES = b'<?xml version="1.0"?><entry><title>Updated</title></entry>'
+
+# HTTPクライアントのテストではWSSEヘッダーの中身を検証しないため固定値を使う
+_FIXED_AUTH_HEADERS = {
+    "X-WSSE": (
+        'UsernameToken Username="test_user_mock", '
+        'PasswordDigest="Zml4ZWRfZGlnZXN0", '
+        'Nonce="Zml4ZWRfbm9uY2U=", '
+        'Created="2024-01-01T00:00:00Z"'
+    ),
+    "Content-Type": "application/atom+xml; charset=utf-8",
+    "User-Agent": "hatena-blog-mcp-server/0.1.0"
+}
+
+
+@pytest.fixture(autouse=True)
+def _fixed_wsse(monkeypatch):
+    """ナンス生成とダイジェスト計算を省略し、固定の認証ヘッダーを返す"""
+    monkeypatch.setattr(
+        AuthenticationManager, "get_auth_headers", lambda self: _FIXED_AUTH_HEADERS
+    )
+
+
 @pytest.fixture
 def auth_config():
     """認証設定のフィクスチャ（テスト専用ダミー値）"""
@@ -38,22 +81,59 @@ def rate_limiter():
     return RateLimiter(max_requests_per_minute=60)  # テスト用に緩い制限
 
 
+class _ScriptedHandler:
+    """MockTransport用ハンドラ（登録順にレスポンスを返し、受信リクエストを記録）"""
+
+    def __init__(self) -> None:
+        self.responses: list[httpx.Response] = []
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.responses:
+            return self.responses.pop(0)
+        return httpx.Response(200)
+
+
 @pytest.fixture
-async def http_client(auth_manager, rate_limiter):
-    """HTTPクライアントのフィクスチャ"""
+def transport_handler():
+    """MockTransportのハンドラのフィクスチャ"""
+    return _ScriptedHandler()
+
+
+@pytest.fixture
+async def http_client(auth_manager, rate_limiter, transport_handler):
+    """HTTPクライアントのフィクスチャ（実ネットワークを使わないMockTransport経由）"""
     client = HatenaHttpClient(
         auth_manager=auth_manager,
         username="test_user",
         blog_id="testblog",
-        rate_limiter=rate_limiter
+        rate_limiter=rate_limiter,
+        transport=httpx.MockTransport(transport_handler)
     )
     yield client
     await client.close()
 
 
+@pytest.fixture
+def patched_client(http_client, transport_handler):
+    """レート制限器の acquire / handle_response をまとめてモックしたクライアント"""
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch.object(http_client.rate_limiter, 'acquire', new_callable=AsyncMock)
+        )
+        stack.enter_context(patch.object(http_client.rate_limiter, 'handle_response'))
+        yield http_client, transport_handler
+
+
 class TestHatenaHttpClient:
     """HatenaHttpClientのテストクラス"""
 
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        """リトライ時のバックオフ待機を全テストで無効化"""
+        monkeypatch.setattr("asyncio.sleep", AsyncMock())
+
     def test_init(self, auth_manager, rate_limiter):
         """初期化のテスト"""
         client = HatenaHttpClient(
@@ -87,204 +167,112 @@ class TestHatenaHttpClient:
         assert url == "https://blog.hatena.ne.jp/test_user/testblog/atom/entry/12345"
 
     @pytest.mark.asyncio
-    async def test_successful_request(self, http_client):
+    async def test_successful_request(self, http_client, transport_handler):
         """成功するリクエストのテスト"""
-        mock_response = Mock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
+        response = await http_client._make_request("GET", "https://example.com")
         
-        with patch.object(http_client._client, 'request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
-            
-            response = await http_client._make_request("GET", "https://example.com")
-            
-            assert response is mock_response
-            mock_request.assert_called_once()
-            
-            # 認証ヘッダーが含まれているかチェック
-            call_kwargs = mock_request.call_args[1]
-            headers = call_kwargs['headers']
-            assert 'X-WSSE' in headers
-            assert 'Content-Type' in headers
-            assert 'User-Agent' in headers
+        assert response.status_code == 200
+        assert len(transport_handler.requests) == 1
+        
+        # 認証ヘッダーが含まれているかチェック
+        headers = transport_handler.requests[0].headers
+        assert 'X-WSSE' in headers
+        assert 'Content-Type' in headers
+        assert 'User-Agent' in headers
 
     @pytest.mark.asyncio
-    async def test_retry_on_server_error(self, http_client):
+    async def test_retry_on_server_error(self, patched_client):
         """サーバーエラー時のリトライテスト"""
+        client, transport_handler = patched_client
         # 最初の2回は500エラー、3回目は成功
-        server_error = httpx.HTTPStatusError(
-            message="Server Error",
-            request=Mock(),
-            response=Mock(status_code=500)
-        )
+        transport_handler.responses = [
+            httpx.Response(500),
+            httpx.Response(500),
+            httpx.Response(200)
+        ]
         
-        success_response = Mock(spec=httpx.Response)
-        success_response.status_code = 200
-        success_response.raise_for_status.return_value = None
+        response = await client._make_request("GET", "https://example.com")
         
-        with patch.object(http_client._client, 'request', new_callable=AsyncMock) as mock_request:
-            mock_request.side_effect = [
-                Mock(raise_for_status=Mock(side_effect=server_error)),
-                Mock(raise_for_status=Mock(side_effect=server_error)),
-                success_response
-            ]
-            
-            # レート制限器の acquire メソッドをモック
-            with patch.object(http_client.rate_limiter, 'acquire', new_callable=AsyncMock):
-                # sleepをモックして高速化
-                with patch('asyncio.sleep', new_callable=AsyncMock):
-                    response = await http_client._make_request("GET", "https://example.com")
-            
-            assert response is success_response
-            assert mock_request.call_count == 3
+        assert response.status_code == 200
+        assert len(transport_handler.requests) == 3
 
     @pytest.mark.asyncio
-    async def test_no_retry_on_client_error(self, http_client):
+    async def test_no_retry_on_client_error(self, patched_client):
         """クライアントエラー時はリトライしないテスト"""
-        client_error = httpx.HTTPStatusError(
-            message="Not Found",
-            request=Mock(),
-            response=Mock(status_code=404)
-        )
-        
-        with patch.object(http_client._client, 'request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = Mock(raise_for_status=Mock(side_effect=client_error))
-            
-            # レート制限器の acquire メソッドをモック
-            with patch.object(http_client.rate_limiter, 'acquire', new_callable=AsyncMock):
-                with pytest.raises(httpx.HTTPStatusError):
-                    await http_client._make_request("GET", "https://example.com")
-            
-            # リトライせずに1回だけ呼ばれる
-            assert mock_request.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_rate_limit_handling(self, http_client):
-        """レート制限処理のテスト"""
-        rate_limit_error = httpx.HTTPStatusError(
-            message="Too Many Requests",
-            request=Mock(),
-            response=Mock(status_code=429, headers={"Retry-After": "60"})
-        )
-        
-        with patch.object(http_client._client, 'request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = Mock(raise_for_status=Mock(side_effect=rate_limit_error))
-            
-            # レート制限器の acquire メソッドをモック
-            with patch.object(http_client.rate_limiter, 'acquire', new_callable=AsyncMock):
-                # handle_response メソッドがレート制限を処理することを確認
-                with patch.object(http_client.rate_limiter, 'handle_response') as mock_handle:
-                    with pytest.raises(httpx.HTTPStatusError):
-                        await http_client._make_request("GET", "https://example.com")
-                    
-                    # レート制限器のhandle_responseが呼ばれることを確認
-                    assert mock_handle.call_count >= 1
-
-    @pytest.mark.asyncio
-    async def test_get_request(self, http_client):
-        """GETリクエストのテスト"""
-        mock_response = Mock(spec=httpx.Response)
-        mock_response.status_code = 200
-        
-        with patch.object(http_client, '_make_request', new_callable=AsyncMock) as mock_make:
-            mock_make.return_value = mock_response
-            
-            response = await http_client.get("/entry", params={"page": 1})
-            
-            assert response is mock_response
-            mock_make.assert_called_once_with(
-                "GET",
-                "https://blog.hatena.ne.jp/test_user/testblog/atom/entry",
-                params={"page": 1},
-                headers=None
-            )
-
-    @pytest.mark.asyncio
-    async def test_post_request_with_xml_element(self, http_client):
-        """XMLエレメントを使ったPOSTリクエストのテスト"""
-        # テスト用XMLエレメント作成
-        entry = etree.Element("entry")
-        title = etree.SubElement(entry, "title")
-        title.text = "Test Entry"
-        
-        mock_response = Mock(spec=httpx.Response)
-        mock_response.status_code = 201
-        
-        with patch.object(http_client, '_make_request', new_callable=AsyncMock) as mock_make:
-            mock_make.return_value = mock_response
-            
-            response = await http_client.post("/entry", entry)
-            
-            assert response is mock_response
-            
-            # XMLがバイト列に変換されて送信されることを確認
-            call_args = mock_make.call_args
-            assert call_args[0][0] == "POST"
-            assert call_args[0][1] == "https://blog.hatena.ne.jp/test_user/testblog/atom/entry"
-            
-            # contentがバイト列であることを確認
-            content = call_args[1]['content']
-            assert isinstance(content, bytes)
-            assert b"Test Entry" in content
-
-    @pytest.mark.asyncio
-    async def test_post_request_with_string(self, http_client):
-        """文字列を使ったPOSTリクエストのテスト"""
-        xml_string = '<?xml version="1.0"?><entry><title>Test</title></entry>'
+        client, transport_handler = patched_client
+        transport_handler.responses = [httpx.Response(404)]
         
-        mock_response = Mock(spec=httpx.Response)
-        mock_response.status_code = 201
+        with pytest.raises(httpx.HTTPStatusError):
+            await client._make_request("GET", "https://example.com")
         
-        with patch.object(http_client, '_make_request', new_callable=AsyncMock) as mock_make:
-            mock_make.return_value = mock_response
-            
-            response = await http_client.post("/entry", xml_string)
-            
-            assert response is mock_response
-            
-            # 文字列がバイト列に変換されて送信されることを確認
-            call_args = mock_make.call_args
-            content = call_args[1]['content']
-            assert isinstance(content, bytes)
-            assert content == xml_string.encode('utf-8')
+        # リトライせずに1回だけ呼ばれる
+        assert len(transport_handler.requests) == 1
 
     @pytest.mark.asyncio
-    async def test_put_request(self, http_client):
-        """PUTリクエストのテスト"""
-        xml_bytes = b'<?xml version="1.0"?><entry><title>Updated</title></entry>'
+    async def test_rate_limit_handling(self, patched_client):
+        """レート制限処理のテスト"""
+        client, transport_handler = patched_client
+        transport_handler.responses = [
+            httpx.Response(429, headers={"Retry-After": "60"})
+            for _ in range(client.max_retries + 1)
+        ]
         
-        mock_response = Mock(spec=httpx.Response)
-        mock_response.status_code = 200
+        with pytest.raises(httpx.HTTPStatusError):
+            await client._make_request("GET", "https://example.com")
         
-        with patch.object(http_client, '_make_request', new_callable=AsyncMock) as mock_make:
-            mock_make.return_value = mock_response
-            
-            response = await http_client.put("/entry/123", xml_bytes)
-            
-            assert response is mock_response
-            mock_make.assert_called_once_with(
-                "PUT",
-                "https://blog.hatena.ne.jp/test_user/testblog/atom/entry/123",
-                content=xml_bytes,
-                headers=None
-            )
+        # レート制限器のhandle_responseが呼ばれることを確認
+        assert client.rate_limiter.handle_response.call_count >= 1
 
     @pytest.mark.asyncio
-    async def test_delete_request(self, http_client):
-        """DELETEリクエストのテスト"""
-        mock_response = Mock(spec=httpx.Response)
-        mock_response.status_code = 204
+    @pytest.mark.parametrize("verb,path,args,kwargs,expected_kwargs", [
+        pytest.param(
+            "GET", "/entry", (), {"params": {"page": 1}},
+            {"params": {"page": 1}, "headers": None},
+            id="get"
+        ),
+        # XMLエレメントはXML宣言付きのバイト列に変換されて送信される
+        pytest.param(
+            "POST", "/entry", (_TEST_ENTRY,), {},
+            {"content": _TEST_ENTRY_BYTES, "headers": None},
+            id="post-xml-element"
+        ),
+        # バイト列はそのまま送信される
+        pytest.param(
+            "POST", "/entry", (_POST_XML_BYTES,), {},
+            {"content": _POST_XML_BYTES, "headers": None},
+            id="post-bytes"
+        ),
+        # 文字列はUTF-8のバイト列に変換されて送信される
+        pytest.param(
+            "POST", "/entry", (_POST_XML_STRING,), {},
+            {"content": _POST_XML_BYTES, "headers": None},
+            id="post-string"
+        ),
+        pytest.param(
+            "PUT", "/entry/123", (_PUT_XML_BYTES,), {},
+            {"content": _PUT_XML_BYTES, "headers": None},
+            id="put"
+        ),
+        pytest.param(
+            "DELETE", "/entry/123", (), {},
+            {"headers": None},
+            id="delete"
+        ),
+    ])
+    async def test_verb_request(self, http_client, verb, path, args, kwargs, expected_kwargs):
+        """各HTTPメソッドのリクエスト組み立てのテスト"""
+        mock_response = FakeResponse()
         
         with patch.object(http_client, '_make_request', new_callable=AsyncMock) as mock_make:
             mock_make.return_value = mock_response
             
-            response = await http_client.delete("/entry/123")
+            response = await getattr(http_client, verb.lower())(path, *args, **kwargs)
             
             assert response is mock_response
             mock_make.assert_called_once_with(
-                "DELETE",
-                "https://blog.hatena.ne.jp/test_user/testblog/atom/entry/123",
-                headers=None
+                verb,
+                f"https://blog.hatena.ne.jp/test_user/testblog/atom{path}",
+                **expected_kwargs
             )
 
     def test_create_network_error(self, http_client):
@@ -1,36 +1,15 @@
 """Unit tests for MarkdownImporter module."""
 
+import io
 import pytest
-from pathlib import Path
-from tempfile import NamedTemporaryFile
 from datetime import datetime
 
 from hatena_blog_mcp.markdown_importer import MarkdownImporter
 from hatena_blog_mcp.models import BlogPost
 
 
-class TestMarkdownImporter:
-    """Test suite for MarkdownImporter."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.importer = MarkdownImporter(enable_front_matter=True)
-        self.importer_no_frontmatter = MarkdownImporter(enable_front_matter=False)
-    
-    def test_init_default(self):
-        """Test default initialization."""
-        importer = MarkdownImporter()
-        assert importer.enable_front_matter is True
-        assert importer.markdown_processor is not None
-    
-    def test_init_disable_frontmatter(self):
-        """Test initialization with Front Matter disabled."""
-        importer = MarkdownImporter(enable_front_matter=False)
-        assert importer.enable_front_matter is False
-    
-    def test_convert_simple_markdown(self):
-        """Test simple Markdown conversion without Front Matter."""
-        markdown_text = """# Test Title
+# Shared Markdown fixtures (built once at import time)
+_SIMPLE_MARKDOWN = """# Test Title
 
 This is a simple paragraph.
 
@@ -41,24 +20,8 @@ This is a simple paragraph.
 print("Hello, World!")
 ```
 """
-        
-        result = self.importer.convert(markdown_text)
-        
-        assert isinstance(result, BlogPost)
-        assert result.title == "Test Title"
-        assert '<h1 id="test-title">Test Title</h1>' in result.content
-        assert "<p>This is a simple paragraph.</p>" in result.content
-        assert "<ul>" in result.content
-        assert "<li>List item 1</li>" in result.content
-        assert "<code" in result.content  # Code block
-        assert result.categories == []
-        assert result.categories == []
-        assert result.draft is False  # Default: not draft
-        assert result.summary == ""
-    
-    def test_convert_with_frontmatter(self):
-        """Test Markdown conversion with Front Matter."""
-        markdown_text = """---
+
+_FM_MARKDOWN = """---
 title: Custom Title
 summary: This is a summary
 categories: [tech, programming]
@@ -70,18 +33,8 @@ draft: true
 
 Content here.
 """
-        
-        result = self.importer.convert(markdown_text)
-        
-        assert result.title == "Custom Title"
-        assert result.summary == "This is a summary"
-        assert result.categories == ["tech", "programming"]
-        assert result.draft is True  # draft: true
-        assert '<h1 id="markdown-title-should-be-ignored">Markdown Title (should be ignored)</h1>' in result.content
-    
-    def test_convert_frontmatter_string_categories(self):
-        """Test Front Matter with comma-separated string categories."""
-        markdown_text = """---
+
+_FM_STRING_CATEGORIES_MARKDOWN = """---
 title: Test Post
 categories: tech, programming, python
 tags: tutorial, guide
@@ -89,14 +42,8 @@ tags: tutorial, guide
 
 Content.
 """
-        
-        result = self.importer.convert(markdown_text)
-        
-        assert result.categories == ["tech", "programming", "python"]
-    
-    def test_convert_frontmatter_single_category(self):
-        """Test Front Matter with single category/tag field."""
-        markdown_text = """---
+
+_FM_SINGLE_CATEGORY_MARKDOWN = """---
 title: Test Post
 category: single-category
 tag: single-tag
@@ -104,14 +51,8 @@ tag: single-tag
 
 Content.
 """
-        
-        result = self.importer.convert(markdown_text)
-        
-        assert result.categories == ["single-category"]
-    
-    def test_convert_no_frontmatter_mode(self):
-        """Test conversion with Front Matter disabled."""
-        markdown_text = """---
+
+_FM_IGNORED_MARKDOWN = """---
 title: Should be ignored
 categories: [ignored]
 ---
@@ -120,21 +61,8 @@ categories: [ignored]
 
 Content.
 """
-        
-        result = self.importer_no_frontmatter.convert(markdown_text)
-        
-        # Should extract title from first H1, ignoring Front Matter
-        assert result.title == "Real Title"
-        assert result.categories == []
-        # Content should include the Front Matter as literal text (converted to HTML)
-        assert "<hr />" in result.content  # --- becomes <hr />
-        assert "title: Should be ignored" in result.content
-    
-    def test_title_extraction_priority(self):
-        """Test title extraction priority: Front Matter > H1 > filename."""
-        
-        # Test 1: Front Matter title has highest priority
-        markdown_with_fm = """---
+
+_FM_TITLE_MARKDOWN = """---
 title: Front Matter Title
 ---
 
@@ -142,29 +70,15 @@ title: Front Matter Title
 
 Content.
 """
-        result = self.importer.convert(markdown_with_fm, filename="file.md")
-        assert result.title == "Front Matter Title"
-        
-        # Test 2: H1 title when no Front Matter
-        markdown_h1 = """# H1 Title
+
+_H1_MARKDOWN = """# H1 Title
 
 Content.
 """
-        result = self.importer.convert(markdown_h1, filename="file.md")
-        assert result.title == "H1 Title"
-        
-        # Test 3: Filename when no Front Matter or H1
-        markdown_plain = """Just content without title."""
-        result = self.importer.convert(markdown_plain, filename="my-article.md")
-        assert result.title == "my-article"
-        
-        # Test 4: Fallback to "Untitled"
-        result = self.importer.convert(markdown_plain, filename=None)
-        assert result.title == "Untitled"
-    
-    def test_load_from_file_success(self):
-        """Test successful file loading."""
-        content = """---
+
+_PLAIN_MARKDOWN = """Just content without title."""
+
+_FILE_MARKDOWN = """---
 title: File Test
 categories: [file, test]
 ---
@@ -173,86 +87,16 @@ categories: [file, test]
 
 This content comes from a file.
 """
-        
-        with NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
-            f.write(content)
-            temp_path = f.name
-        
-        try:
-            result = self.importer.load_from_file(temp_path)
-            
-            assert result.title == "File Test"
-            assert result.categories == ["file", "test"]
-            assert "This content comes from a file." in result.content
-        finally:
-            Path(temp_path).unlink()  # Clean up
-    
-    def test_load_from_file_not_found(self):
-        """Test file not found error."""
-        with pytest.raises(FileNotFoundError, match="Markdown file not found"):
-            self.importer.load_from_file("nonexistent.md")
-    
-    def test_load_from_file_is_directory(self):
-        """Test error when path is a directory."""
-        with pytest.raises(ValueError, match="Path is not a file"):
-            self.importer.load_from_file(".")
-    
-    def test_convert_invalid_yaml(self):
-        """Test handling of invalid YAML Front Matter."""
-        markdown_text = """---
-title: Test
-invalid_yaml: [unclosed list
----
-
-Content.
-"""
-        
-        # Should handle gracefully and still process content
-        with pytest.raises(ValueError, match="Failed to convert Markdown"):
-            self.importer.convert(markdown_text)
-    
-    def test_metadata_edge_cases(self):
-        """Test various edge cases in metadata extraction."""
-        
-        # Empty categories/tags
-        markdown_text = """---
-title: Test
-categories: []
-tags: []
----
 
-Content.
-"""
-        result = self.importer.convert(markdown_text)
-        assert result.categories == []
-        
-        # None values
-        markdown_text = """---
+_INVALID_YAML_MARKDOWN = """---
 title: Test
-categories: 
-tags: 
+invalid_yaml: [unclosed list
 ---
 
 Content.
 """
-        result = self.importer.convert(markdown_text)
-        assert result.categories == []
-        
-        # Mixed empty and valid
-        markdown_text = """---
-title: Test
-categories: [valid, "", "  ", another]
-tags: "one, , three"
----
 
-Content.
-"""
-        result = self.importer.convert(markdown_text)
-        assert result.categories == ["valid", "another"]  # Empty strings filtered out
-    
-    def test_html_conversion_features(self):
-        """Test that Markdown features are properly converted to HTML."""
-        markdown_text = """# Main Title
+_HTML_FEATURES_MARKDOWN = """# Main Title
 
 ## Subtitle
 
@@ -271,25 +115,204 @@ def hello():
 
 > Blockquote text
 """
-        
-        result = self.importer.convert(markdown_text)
-        
+
+# HTML fragments expected in the converted output
+_SIMPLE_HTML_FRAGMENTS = (
+    '<h1 id="test-title">Test Title</h1>',
+    "<p>This is a simple paragraph.</p>",
+    "<ul>",
+    "<li>List item 1</li>",
+    "<code",  # Code block
+)
+
+_FEATURE_HTML_FRAGMENTS = (
+    '<h1 id="main-title">Main Title</h1>',
+    '<h2 id="subtitle">Subtitle</h2>',
+    "<strong>Bold text</strong>",
+    "<em>italic text</em>",
+    '<a href="https://example.com">Link</a>',
+    "<table>",
+    "<tr>",
+    "<td>",
+    "<code",
+    "<blockquote>",
+)
+
+_FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns a fixed instant."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _FROZEN_NOW
+
+
+@pytest.fixture(autouse=True)
+def _frozen_time(monkeypatch):
+    """Pin the timestamp used during conversion."""
+    monkeypatch.setattr("hatena_blog_mcp.markdown_importer.datetime", _FrozenDatetime)
+
+
+@pytest.fixture(scope="module")
+def importer():
+    """Importer with front matter enabled, shared across the module."""
+    return MarkdownImporter(enable_front_matter=True)
+
+
+@pytest.fixture(scope="module")
+def importer_no_frontmatter():
+    """Importer with front matter disabled, shared across the module."""
+    return MarkdownImporter(enable_front_matter=False)
+
+
+class TestMarkdownImporter:
+    """Test suite for MarkdownImporter."""
+
+    def test_init_default(self):
+        """Test default initialization."""
+        importer = MarkdownImporter()
+        assert importer.enable_front_matter is True
+        assert importer.markdown_processor is not None
+
+    def test_init_disable_frontmatter(self):
+        """Test initialization with Front Matter disabled."""
+        importer = MarkdownImporter(enable_front_matter=False)
+        assert importer.enable_front_matter is False
+
+    def test_markdown_processor_shared(self):
+        """Test that importers share a single Markdown processor."""
+        first = MarkdownImporter()
+        second = MarkdownImporter(enable_front_matter=False)
+        assert first.markdown_processor is second.markdown_processor
+
+    def test_convert_simple_markdown(self, importer):
+        """Test simple Markdown conversion without Front Matter."""
+        result = importer.convert(_SIMPLE_MARKDOWN)
+
+        assert isinstance(result, BlogPost)
+        assert result.title == "Test Title"
+        missing = [f for f in _SIMPLE_HTML_FRAGMENTS if f not in result.content]
+        assert not missing, missing
+        assert result.categories == ()
+        assert result.draft is False  # Default: not draft
+        assert result.summary == ""
+
+    def test_convert_with_frontmatter(self, importer):
+        """Test Markdown conversion with Front Matter."""
+        result = importer.convert(_FM_MARKDOWN)
+
+        assert result.title == "Custom Title"
+        assert result.summary == "This is a summary"
+        assert result.categories == ("tech", "programming")
+        assert result.draft is True  # draft: true
+        assert '<h1 id="markdown-title-should-be-ignored">Markdown Title (should be ignored)</h1>' in result.content
+
+    def test_convert_frontmatter_string_categories(self, importer):
+        """Test Front Matter with comma-separated string categories."""
+        result = importer.convert(_FM_STRING_CATEGORIES_MARKDOWN)
+
+        assert result.categories == ("tech", "programming", "python")
+
+    def test_convert_frontmatter_single_category(self, importer):
+        """Test Front Matter with single category/tag field."""
+        result = importer.convert(_FM_SINGLE_CATEGORY_MARKDOWN)
+
+        assert result.categories == ("single-category",)
+
+    def test_convert_no_frontmatter_mode(self, importer_no_frontmatter):
+        """Test conversion with Front Matter disabled."""
+        result = importer_no_frontmatter.convert(_FM_IGNORED_MARKDOWN)
+
+        # Should extract title from first H1, ignoring Front Matter
+        assert result.title == "Real Title"
+        assert result.categories == ()
+        # Content should include the Front Matter as literal text (converted to HTML)
+        assert "<hr />" in result.content  # --- becomes <hr />
+        assert "title: Should be ignored" in result.content
+
+    @pytest.mark.parametrize("markdown_text,filename,expected", [
+        # Front Matter title has highest priority
+        (_FM_TITLE_MARKDOWN, "file.md", "Front Matter Title"),
+        # H1 title when no Front Matter
+        (_H1_MARKDOWN, "file.md", "H1 Title"),
+        # Filename when no Front Matter or H1
+        (_PLAIN_MARKDOWN, "my-article.md", "my-article"),
+        # Fallback to "Untitled"
+        (_PLAIN_MARKDOWN, None, "Untitled"),
+    ])
+    def test_title_extraction_priority(self, importer, markdown_text, filename, expected):
+        """Test title extraction priority: Front Matter > H1 > filename."""
+        result = importer.convert(markdown_text, filename=filename)
+        assert result.title == expected
+
+    def test_load_from_file_success(self, importer):
+        """Test successful file loading."""
+        result = importer.load_from_file(io.StringIO(_FILE_MARKDOWN))
+
+        assert result.title == "File Test"
+        assert result.categories == ("file", "test")
+        assert "This content comes from a file." in result.content
+
+    def test_load_from_file_path(self, importer, tmp_path):
+        """Test loading from a filesystem path."""
+        md_path = tmp_path / "my-article.md"
+        md_path.write_text(_PLAIN_MARKDOWN, encoding="utf-8")
+
+        result = importer.load_from_file(md_path)
+
+        # Filename is used as the title fallback
+        assert result.title == "my-article"
+
+    def test_load_from_file_not_found(self, importer, tmp_path):
+        """Test file not found error."""
+        with pytest.raises(FileNotFoundError) as exc_info:
+            importer.load_from_file(tmp_path / "nonexistent.md")
+        assert "Markdown file not found" in str(exc_info.value)
+
+    def test_load_from_file_is_directory(self, importer, tmp_path):
+        """Test error when path is a directory."""
+        with pytest.raises(ValueError) as exc_info:
+            importer.load_from_file(tmp_path)
+        assert "Path is not a file" in str(exc_info.value)
+
+    def test_convert_invalid_yaml(self, importer):
+        """Test handling of invalid YAML Front Matter."""
+        # Should handle gracefully and still process content
+        with pytest.raises(ValueError) as exc_info:
+            importer.convert(_INVALID_YAML_MARKDOWN)
+        assert "Failed to convert Markdown" in str(exc_info.value)
+
+    @pytest.mark.parametrize("markdown_text,expected", [
+        # Empty categories/tags
+        ("---\ntitle: Test\ncategories: []\ntags: []\n---\n\nContent.\n", ()),
+        # None values
+        ("---\ntitle: Test\ncategories: \ntags: \n---\n\nContent.\n", ()),
+        # Mixed empty and valid (empty strings filtered out)
+        (
+            '---\ntitle: Test\ncategories: [valid, "", "  ", another]\n'
+            'tags: "one, , three"\n---\n\nContent.\n',
+            ("valid", "another"),
+        ),
+    ])
+    def test_metadata_edge_cases(self, importer, markdown_text, expected):
+        """Test various edge cases in metadata extraction."""
+        result = importer.convert(markdown_text)
+        assert result.categories == expected
+
+    def test_html_conversion_features(self, importer):
+        """Test that Markdown features are properly converted to HTML."""
+        result = importer.convert(_HTML_FEATURES_MARKDOWN)
+
         # Check various HTML elements are present
-        assert '<h1 id="main-title">Main Title</h1>' in result.content
-        assert '<h2 id="subtitle">Subtitle</h2>' in result.content
-        assert "<strong>Bold text</strong>" in result.content
-        assert "<em>italic text</em>" in result.content
-        assert '<a href="https://example.com">Link</a>' in result.content
-        assert "<table>" in result.content
-        assert "<tr>" in result.content
-        assert "<td>" in result.content
-        assert "<code" in result.content
-        assert "<blockquote>" in result.content
-    
-    def test_blogpost_attributes(self):
+        missing = [f for f in _FEATURE_HTML_FRAGMENTS if f not in result.content]
+        assert not missing, missing
+
+    def test_blogpost_attributes(self, importer):
         """Test that BlogPost object has correct attributes."""
-        result = self.importer.convert("# Test")
-        
+        result = importer.convert("# Test")
+
         # Check all required BlogPost attributes exist
         assert hasattr(result, 'id')
         assert hasattr(result, 'title')
@@ -299,8 +322,10 @@ def hello():
         assert hasattr(result, 'summary')
         assert hasattr(result, 'created_at')
         assert hasattr(result, 'updated_at')
-        
+
         # Check default values
         assert result.id is None
         assert isinstance(result.created_at, datetime)
-        assert isinstance(result.updated_at, datetime)
\ No newline at end of file
+        assert isinstance(result.updated_at, datetime)
+        assert result.created_at == _FROZEN_NOW
+        assert result.updated_at == _FROZEN_NOW
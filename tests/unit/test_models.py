@@ -5,7 +5,7 @@ Tests for Data Models.
 from datetime import datetime
 
 import pytest
-from pydantic import ValidationError
+from pydantic import SecretStr, ValidationError
 
 from hatena_blog_mcp.models import (
     ApiResponse,
@@ -38,15 +38,14 @@ class TestAuthConfig:
         config = AuthConfig(username="test_user", password="mock_password_test")
 
         assert config.username == "test_user"
-        assert config.password == "mock_password_test"
+        assert config.password.get_secret_value() == "mock_password_test"
 
     def test_auth_config_password_hidden_in_repr(self):
         """パスワードが表示に含まれないことを確認"""
         config = AuthConfig(username="test_user", password="mock_secret_for_testing")
 
-        config_str = str(config)
-        assert "test_user" in config_str
-        assert "mock_secret_for_testing" not in config_str
+        assert isinstance(config.password, SecretStr)
+        assert str(config.password) == "**********"
 
     def test_auth_config_missing_fields(self):
         """必須フィールド不足のテスト"""
@@ -75,7 +74,7 @@ class TestBlogConfig:
 
         assert config.username == "testuser"
         assert config.blog_id == "test_blog"
-        assert config.api_key == "mock_api_key_test"
+        assert config.api_key.get_secret_value() == "mock_api_key_test"
 
     def test_blog_config_api_key_hidden_in_repr(self):
         """APIキーが表示に含まれないことを確認"""
@@ -85,10 +84,8 @@ class TestBlogConfig:
             api_key="mock_secret_for_testing"
         )
 
-        config_str = str(config)
-        assert "test_user" in config_str
-        assert "test_blog" in config_str
-        assert "mock_secret_for_testing" not in config_str
+        assert isinstance(config.api_key, SecretStr)
+        assert str(config.api_key) == "**********"
 
     def test_blog_config_missing_fields(self):
         """必須フィールド不足のテスト"""
@@ -111,7 +108,7 @@ class TestBlogPost:
 
         assert post.title == "テストタイトル"
         assert post.content == "テスト本文"
-        assert post.categories == []
+        assert post.categories == ()
         assert post.post_id is None
         assert post.post_url is None
         assert post.created_at is None
@@ -129,16 +126,34 @@ class TestBlogPost:
             post_id="123456",
             post_url="https://example.hatenablog.com/entry/test",
             created_at=created_time,
-            updated_at=updated_time
+            updated_at=updated_time,
+            id="tag:example.com,2024:entry-123456",
+            author="testuser",
+            summary="テスト概要",
+            published=created_time,
+            updated=updated_time,
+            draft=False,
+            edit_url="https://blog.hatena.ne.jp/user/blog/atom/entry/123456",
+            self_url="https://blog.hatena.ne.jp/user/blog/atom/entry/123456",
+            alternate_url="https://example.hatenablog.com/entry/test",
         )
 
         assert post.title == "テストタイトル"
         assert post.content == "テスト本文"
-        assert post.categories == ["カテゴリ1", "カテゴリ2"]
+        assert post.categories == ("カテゴリ1", "カテゴリ2")
         assert post.post_id == "123456"
         assert post.post_url == "https://example.hatenablog.com/entry/test"
         assert post.created_at == created_time
         assert post.updated_at == updated_time
+        assert post.id == "tag:example.com,2024:entry-123456"
+        assert post.author == "testuser"
+        assert post.summary == "テスト概要"
+        assert post.published == created_time
+        assert post.updated == updated_time
+        assert post.draft is False
+        assert post.edit_url == "https://blog.hatena.ne.jp/user/blog/atom/entry/123456"
+        assert post.self_url == "https://blog.hatena.ne.jp/user/blog/atom/entry/123456"
+        assert post.alternate_url == "https://example.hatenablog.com/entry/test"
 
     def test_blog_post_missing_required_fields(self):
         """必須フィールド不足のテスト"""
@@ -152,9 +167,26 @@ class TestBlogPost:
         """カテゴリのデフォルト値テスト"""
         post = BlogPost(title="テスト", content="テスト")
 
-        assert isinstance(post.categories, list)
+        assert isinstance(post.categories, tuple)
         assert len(post.categories) == 0
 
+    @pytest.mark.parametrize("categories", [
+        ["a", "b"],
+        ("a", "b"),
+        {"a": None, "b": None}.keys(),
+        (c for c in ("a", "b")),
+    ])
+    def test_blog_post_categories_normalized_to_tuple(self, categories):
+        """カテゴリが入力の型によらずタプルに正規化されることのテスト"""
+        post = BlogPost(title="テスト", content="テスト", categories=categories)
+
+        assert post.categories == ("a", "b")
+
+    def test_blog_post_categories_rejects_string(self):
+        """文字列をカテゴリ一覧として受け付けないことのテスト"""
+        with pytest.raises(ValidationError):
+            BlogPost(title="テスト", content="テスト", categories="ab")
+
 
 class TestErrorInfo:
     """エラー情報のテスト"""
@@ -245,9 +277,9 @@ class TestApiResponse:
 class TestModelIntegration:
     """モデル統合テスト"""
 
-    def test_blog_post_to_api_response(self):
+    def test_blog_post_to_api_response(self, fast_blog_post):
         """ブログ記事からAPI応答への変換テスト"""
-        post = BlogPost(
+        post = fast_blog_post(
             title="テスト記事",
             content="テスト内容",
             post_id="123",
@@ -263,9 +295,9 @@ class TestModelIntegration:
         assert response.data["title"] == "テスト記事"
         assert response.data["post_id"] == "123"
 
-    def test_error_info_to_api_response(self):
+    def test_error_info_to_api_response(self, fast_error_info):
         """エラー情報からAPI応答への変換テスト"""
-        error = ErrorInfo(
+        error = fast_error_info(
             error_type=ErrorType.AUTH_ERROR,
             message="認証が必要です",
             details={"action": "login_required"}
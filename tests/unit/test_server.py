@@ -1,10 +1,5 @@
 """Unit tests for the MCP server"""
 
-import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
-
 from hatena_blog_mcp.server import hello_world
 
 
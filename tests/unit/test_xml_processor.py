@@ -3,6 +3,8 @@ Tests for AtomPub XML Processing.
 AtomPub XML処理機能のユニットテストです。
 """
 
+import io
+import threading
 import pytest
 from datetime import datetime, timezone
 from lxml import etree
@@ -209,7 +211,7 @@ class TestAtomPubProcessor:
         assert blog_post.content == "<p>解析テスト内容</p>"
         assert blog_post.author == "testuser"
         assert blog_post.summary == "テスト概要"
-        assert blog_post.categories == ["テスト", "XML"]
+        assert blog_post.categories == ("テスト", "XML")
         assert blog_post.published.year == 2024
         assert blog_post.published.month == 1
         assert blog_post.published.day == 1
@@ -235,7 +237,7 @@ class TestAtomPubProcessor:
         assert blog_post.content == "最小内容"
         assert blog_post.id is None
         assert blog_post.author is None
-        assert blog_post.categories == []
+        assert blog_post.categories == ()
 
     def test_parse_entry_xml_draft(self, processor):
         """下書き記事XML解析のテスト"""
@@ -339,18 +341,90 @@ class TestAtomPubProcessor:
         assert len(blog_posts) == 1
         assert blog_posts[0].title == "正常記事"
 
+    def test_parse_feed_xml_stream(self, processor):
+        """ファイルオブジェクトからのフィードXML逐次解析のテスト"""
+        feed_xml = """<?xml version="1.0" encoding="utf-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <title>テストフィード</title>
+            <entry>
+                <title>記事1</title>
+                <content type="text/html">内容1</content>
+            </entry>
+            <entry>
+                <title>記事2</title>
+                <content type="text/html">内容2</content>
+            </entry>
+        </feed>""".encode("utf-8")
+        
+        blog_posts = processor.parse_feed_xml(io.BytesIO(feed_xml))
+        
+        assert [post.title for post in blog_posts] == ["記事1", "記事2"]
+        assert [post.content for post in blog_posts] == ["内容1", "内容2"]
+
+    def test_parse_feed_xml_external_entity_not_expanded(self, processor, tmp_path):
+        """フィード内の外部エンティティが展開されないことのテスト"""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("SECRETDATA", encoding="utf-8")
+        feed_xml = f"""<?xml version="1.0" encoding="utf-8"?>
+        <!DOCTYPE feed [<!ENTITY x SYSTEM "{secret.as_uri()}">]>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <title>&x;</title>
+                <content type="text/html">内容</content>
+            </entry>
+        </feed>"""
+        
+        blog_posts = processor.parse_feed_xml(feed_xml)
+        
+        assert all("SECRETDATA" not in post.title for post in blog_posts)
+
+    @pytest.mark.parametrize("feed_xml, expected_titles", [
+        pytest.param(
+            b'<feed xmlns="http://www.w3.org/2005/Atom">'
+            b'<entry><title>t1</title><content>c</content></entry>'
+            b'<x><entry><title>t2</title><content>c</content></entry></x>'
+            b'</feed>',
+            ["t1", "t2"],
+            id="nested-entry"
+        ),
+        pytest.param(
+            b'<entry xmlns="http://www.w3.org/2005/Atom"><title>t</title><content>c</content></entry>',
+            [],
+            id="entry-root"
+        ),
+    ])
+    def test_parse_feed_xml_same_result_for_bytes_and_element(
+        self, processor, feed_xml, expected_titles
+    ):
+        """同じXMLならバイト列とElementで解析結果が一致することのテスト"""
+        from_bytes = processor.parse_feed_xml(feed_xml)
+        from_element = processor.parse_feed_xml(etree.fromstring(feed_xml))
+
+        assert [post.title for post in from_bytes] == expected_titles
+        assert [post.title for post in from_element] == expected_titles
+
     def test_to_xml_string(self, processor, sample_blog_post):
         """XML文字列変換のテスト"""
         entry = processor.create_entry_xml(sample_blog_post)
-        xml_string = processor.to_xml_string(entry)
+        xml_bytes = processor.to_xml_string(entry)
         
-        assert '<?xml version=' in xml_string
-        assert 'テストブログ記事' in xml_string
-        assert 'これはテスト記事です' in xml_string
+        assert isinstance(xml_bytes, bytes)
+        assert b'<?xml version=' in xml_bytes
+        assert 'テストブログ記事'.encode('utf-8') in xml_bytes
+        assert 'これはテスト記事です'.encode('utf-8') in xml_bytes
         
         # pretty_print=Falseのテスト
         compact_xml = processor.to_xml_string(entry, pretty_print=False)
-        assert '\n' not in compact_xml.split('?>')[1]  # XML宣言以降に改行がない
+        assert b'\n' not in compact_xml.split(b'?>')[1]  # XML宣言以降に改行がない
+        
+        # as_str=Trueのテスト
+        xml_string = processor.to_xml_string(entry, as_str=True)
+        assert xml_string == xml_bytes.decode('utf-8')
+        
+        # include_declaration=Falseのテスト
+        body_only = processor.to_xml_string(entry, include_declaration=False)
+        assert body_only.startswith(b'<entry')
+        assert xml_bytes.endswith(body_only)
 
     def test_validate_xml_valid(self, processor):
         """有効なXMLの検証テスト"""
@@ -374,6 +448,17 @@ class TestAtomPubProcessor:
         
         assert processor.validate_xml(entry) is True
 
+    def test_parser_reused_per_thread(self, processor):
+        """XMLパーサーがスレッドごとに再利用されることのテスト"""
+        parser = processor._get_parser()
+        assert processor._get_parser() is parser
+        
+        other = []
+        thread = threading.Thread(target=lambda: other.append(processor._get_parser()))
+        thread.start()
+        thread.join()
+        assert other[0] is not parser
+
     def test_create_xml_error(self, processor):
         """XML処理エラー作成のテスト"""
         # lxmlのXMLSyntaxErrorのコンストラクタ仕様に依存せず、シンプルな例外を渡す
@@ -393,8 +478,8 @@ class TestAtomPubProcessor:
         """XML生成・解析の往復変換テスト"""
         # BlogPost -> XML -> BlogPost
         entry_xml = processor.create_entry_xml(sample_blog_post)
-        xml_string = processor.to_xml_string(entry_xml)
-        parsed_post = processor.parse_entry_xml(xml_string)
+        xml_bytes = processor.to_xml_string(entry_xml, include_declaration=False)
+        parsed_post = processor.parse_entry_xml(xml_bytes)
         
         # 基本的な情報が保持されることを確認
         assert parsed_post.title == sample_blog_post.title